@@ -1,8 +1,10 @@
 """Database initialization and session management."""
 import os
 import logging
+import secrets
 from datetime import datetime
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
 
@@ -12,10 +14,19 @@ logger = logging.getLogger(__name__)
 # Otherwise fall back to local SQLite
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Keep enough pooled connections for the threadpool that runs sync endpoints,
+# while 4 workers × 15 stays under PostgreSQL's default max_connections of 100
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "5")),
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+}
+
 if DATABASE_URL:
     # PostgreSQL on Railway (or any PostgreSQL)
     logger.info(f"Using PostgreSQL database")
-    engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+    engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True, **POOL_OPTIONS)
 else:
     # Local SQLite
     logger.info("Using local SQLite database")
@@ -26,8 +37,20 @@ else:
         DATABASE_URL,
         connect_args={"check_same_thread": False},
         echo=False,
+        **POOL_OPTIONS,
     )
 
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block on writers, and skip fsync on every commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -46,16 +69,41 @@ def get_db():
         db.close()
 
 
+_db_initialized = False
+
+
 def init_db():
-    """Create all tables and seed default data."""
+    """Create all tables and seed default data (once per process)."""
+    global _db_initialized
+    if _db_initialized:
+        return
+    
     Base.metadata.create_all(bind=engine)
+    # create_all() skips tables that already exist, so add any indexes
+    # introduced since the database was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        # Superseded by the partial idx_sessions_active
+        conn.execute(text("DROP INDEX IF EXISTS idx_end_utc_is_null"))
     
     # Seed default categories if none exist
     db = SessionLocal()
     try:
-        from app.models import Category
-        existing = db.query(Category).count()
-        if existing == 0:
+        from app.models import Category, DataVersion
+        
+        if db.get(DataVersion, 1) is None:
+            try:
+                # Start at a random point so a reset or restored database
+                # never reissues ETags a browser cached for other content
+                db.add(DataVersion(id=1, version=secrets.randbelow(2**30)))
+                db.commit()
+            except IntegrityError:
+                # Another worker seeded it first
+                db.rollback()
+        
+        if db.query(Category.id).first() is None:
             defaults = [
                 {"name": "Coding", "sort_order": 10},
                 {"name": "Meetings", "sort_order": 20},
@@ -63,13 +111,13 @@ def init_db():
                 {"name": "Planning", "sort_order": 40},
                 {"name": "Admin", "sort_order": 50},
             ]
-            for item in defaults:
-                cat = Category(
-                    name=item["name"],
-                    sort_order=item["sort_order"],
-                    created_utc=datetime.utcnow().isoformat() + "Z",
-                )
-                db.add(cat)
+            now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+            db.bulk_insert_mappings(
+                Category,
+                [{**item, "created_utc": now} for item in defaults],
+            )
             db.commit()
     finally:
         db.close()
+    
+    _db_initialized = True
@@ -1,23 +1,28 @@
 """FastAPI application for Work Time Tracker."""
 import csv
+import hashlib
 import logging
+import os
+import re
 from io import StringIO
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import FastAPI, Depends, HTTPException, Form, Request
-from fastapi.responses import HTMLResponse, StreamingResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+from pydantic import BaseModel
+from sqlalchemy import Integer, String, Text, and_, bindparam, delete, exists, func, insert, literal, null, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from dateutil import parser as date_parser
 
-from app.db import get_db, init_db
-from app.models import Category, Session as SessionModel
+from app.db import SessionLocal, get_db, init_db
+from app.models import Category, DataVersion, Session as SessionModel
 
-# Setup logging for debugging
+# Setup logging; set LOG_LEVEL=DEBUG to trace requests
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -26,105 +31,238 @@ logger = logging.getLogger(__name__)
 init_db()
 
 # FastAPI app setup
-app = FastAPI(title="Work Time Tracker")
+app = FastAPI(title="Work Time Tracker", default_response_class=ORJSONResponse)
 
 # Static files
-import os
 static_path = os.path.join(os.path.dirname(__file__), "static")
 app.mount("/static", StaticFiles(directory=static_path), name="static")
 
-# Jinja2 setup
+# Jinja2 setup; the Docker build precompiles templates into Python modules
 template_path = os.path.join(os.path.dirname(__file__), "templates")
-jinja_env = Environment(loader=FileSystemLoader(template_path))
+compiled_template_path = os.path.join(os.path.dirname(__file__), "templates_compiled")
+if os.path.isdir(compiled_template_path):
+    template_loader = ModuleLoader(compiled_template_path)
+else:
+    template_loader = FileSystemLoader(template_path)
+jinja_env = Environment(
+    loader=template_loader,
+    auto_reload=False,  # templates only change on deploy; skip the per-render stat
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+index_template = jinja_env.get_template("index.html")
+categories_template = jinja_env.get_template("categories.html")
+
+# Changes whenever a template does, so a deploy invalidates cached pages
+template_digest = hashlib.sha1()
+for name in sorted(os.listdir(template_path)):
+    with open(os.path.join(template_path, name), "rb") as f:
+        template_digest.update(f.read())
+TEMPLATE_VERSION = template_digest.hexdigest()[:12]
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+# Sessions, most recent first, with the name of their category (NULL when the
+# category is missing or inactive). Executed as a Core select, so results are
+# plain rows rather than ORM objects.
+SESSION_LIST_QUERY = (
+    select(
+        SessionModel.id,
+        SessionModel.category_id,
+        SessionModel.description,
+        SessionModel.start_utc,
+        SessionModel.end_utc,
+        Category.name.label("category_name"),
+    )
+    .outerjoin(Category, and_(Category.id == SessionModel.category_id, Category.is_active == 1))
+    .order_by(SessionModel.start_utc.desc())
+)
+
+# Hot lookups, built once so each request only binds parameters and reuses
+# SQLAlchemy's cached compilation
+ACTIVE_SESSION_QUERY = select(SessionModel).where(SessionModel.end_utc.is_(None)).limit(1)
+CATEGORY_BY_ID_QUERY = select(Category).where(Category.id == bindparam("category_id"))
+ACTIVE_CATEGORY_BY_ID_QUERY = CATEGORY_BY_ID_QUERY.where(Category.is_active == 1)
+ACTIVE_CATEGORY_IDS_QUERY = select(Category.id).where(
+    Category.id.in_(bindparam("category_ids", expanding=True)),
+    Category.is_active == 1,
+)
+CATEGORY_IDS_BY_NAME_QUERY = select(Category.name, Category.id)
+ALL_CATEGORIES_QUERY = select(Category).order_by(Category.sort_order)
+ACTIVE_CATEGORIES_QUERY = ALL_CATEGORIES_QUERY.where(Category.is_active == 1)
+
+# Start a session in a single INSERT ... SELECT that inserts nothing while
+# another session is running (or, for the category variant, when the category
+# is missing or inactive)
+_new_session_row = select(
+    bindparam("category_id", type_=Integer),
+    bindparam("description", type_=Text),
+    bindparam("now", type_=String),
+    null(),
+    bindparam("now", type_=String),
+    bindparam("now", type_=String),
+).where(~exists().where(SessionModel.end_utc.is_(None)))
+_new_session_columns = ["category_id", "description", "start_utc", "end_utc", "created_utc", "updated_utc"]
+# Targets the Core table: an ORM insert() would treat the parameters as bulk rows
+START_SESSION_STMT = insert(SessionModel.__table__).from_select(_new_session_columns, _new_session_row)
+START_SESSION_WITH_CATEGORY_STMT = insert(SessionModel.__table__).from_select(
+    _new_session_columns,
+    _new_session_row.where(
+        exists().where(Category.id == bindparam("category_id"), Category.is_active == 1)
+    ),
+)
+
+# Add a category after the current last one, computing sort_order in the same
+# INSERT ... SELECT
+ADD_CATEGORY_STMT = insert(Category.__table__).from_select(
+    ["name", "is_active", "sort_order", "created_utc"],
+    select(
+        bindparam("name", type_=String),
+        literal(1),
+        func.coalesce(func.max(Category.sort_order), 0) + 10,
+        bindparam("now", type_=String),
+    ),
+)
+
+# Every write bumps the version in the same transaction, so a page or export
+# tagged with it stays valid until the next write from any worker
+DATA_VERSION_QUERY = select(DataVersion.version).where(DataVersion.id == 1)
+BUMP_DATA_VERSION_STMT = (
+    update(DataVersion)
+    .where(DataVersion.id == 1)
+    .values(version=DataVersion.version + 1)
+)
+
+
 def get_active_session(db: Session) -> Optional[SessionModel]:
     """Get the currently running session (end_utc is NULL)."""
-    return db.query(SessionModel).filter(SessionModel.end_utc.is_(None)).first()
+    return db.scalars(ACTIVE_SESSION_QUERY).first()
+
+
+# Stored timestamp format, e.g. 2025-01-26T09:00:00Z
+UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def utc_now_iso() -> str:
+    """Current UTC time in the stored timestamp format."""
+    return datetime.utcnow().strftime(UTC_FORMAT)
+
+
+def parse_utc(iso: str) -> datetime:
+    """Parse an ISO-8601 UTC timestamp (e.g. 2025-01-26T09:00:00Z) as a naive datetime."""
+    return datetime.fromisoformat(iso.removesuffix("Z"))
+
+
+def format_utc(dt: datetime) -> str:
+    """Format a datetime in the stored timestamp format, dropping microseconds and any offset."""
+    return dt.strftime(UTC_FORMAT)
 
 
 def format_time_diff(start_iso: str, end_iso: Optional[str] = None) -> str:
     """Format time difference as HH:MM:SS."""
     try:
-        start = date_parser.isoparse(start_iso)
+        start = parse_utc(start_iso)
         if end_iso:
-            end = date_parser.isoparse(end_iso)
+            end = parse_utc(end_iso)
         else:
             end = datetime.utcnow()
         
         delta = end - start
-        total_seconds = int(delta.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        hours, remainder = divmod(int(delta.total_seconds()), 3600)
+        minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     except Exception:
         return "00:00:00"
 
 
+def format_session(sess) -> dict:
+    """Format a SESSION_LIST_QUERY row for the dashboard and JSON API."""
+    return {
+        "id": sess.id,
+        "category_name": sess.category_name or "(No Category)",
+        "category_id": sess.category_id,
+        "description": sess.description,
+        "start_utc": sess.start_utc,
+        "end_utc": sess.end_utc,
+        "duration": format_time_diff(sess.start_utc, sess.end_utc) if sess.end_utc else None,
+        "is_running": sess.end_utc is None,
+    }
+
+
+def bump_data_version(db: Session) -> None:
+    """Mark cached pages and exports stale; call before committing a write."""
+    db.execute(BUMP_DATA_VERSION_STMT)
+
+
+def get_etag(db: Session) -> str:
+    """ETag for the current data and templates."""
+    return f'W/"{TEMPLATE_VERSION}-{db.scalar(DATA_VERSION_QUERY)}"'
+
+
 def get_category_by_id(db: Session, category_id: int) -> Optional[Category]:
     """Get an active category by ID."""
-    return db.query(Category).filter(
-        Category.id == category_id,
-        Category.is_active == 1
-    ).first()
+    return db.scalars(ACTIVE_CATEGORY_BY_ID_QUERY, {"category_id": category_id}).first()
 
 
 # ============================================================================
 # Pages
 # ============================================================================
 
+# Last rendered dashboard as (etag, html)
+home_page_cache = (None, None)
+
+
 @app.get("/", response_class=HTMLResponse)
-def home(db: Session = Depends(get_db)):
+def home(request: Request, db: Session = Depends(get_db)):
     """Home page dashboard."""
-    active_session = get_active_session(db)
+    global home_page_cache
+    # Read the version before the data: the page can then only be newer than
+    # its tag, never older
+    etag = get_etag(db)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    cached_etag, html = home_page_cache
+    if cached_etag == etag:
+        return HTMLResponse(html, headers=headers)
     
     # Get all sessions, most recent first
-    sessions = db.query(SessionModel).order_by(SessionModel.start_utc.desc()).all()
+    sessions = db.execute(SESSION_LIST_QUERY).all()
     
-    # Get active categories
-    categories = db.query(Category).filter(Category.is_active == 1).order_by(Category.sort_order).all()
+    # The running session is already in the list; no need to query for it again
+    active_session = next((sess for sess in sessions if sess.end_utc is None), None)
     
-    # Format session data for template
-    sessions_data = []
-    for sess in sessions:
-        cat = get_category_by_id(db, sess.category_id) if sess.category_id else None
-        duration = format_time_diff(sess.start_utc, sess.end_utc) if sess.end_utc else None
-        sessions_data.append({
-            "id": sess.id,
-            "category_name": cat.name if cat else "(No Category)",
-            "category_id": sess.category_id,
-            "description": sess.description,
-            "start_utc": sess.start_utc,
-            "end_utc": sess.end_utc,
-            "duration": duration,
-            "is_running": sess.end_utc is None,
-        })
+    # Get active categories
+    categories = db.scalars(ACTIVE_CATEGORIES_QUERY).all()
     
-    template = jinja_env.get_template("index.html")
-    return template.render(
+    html = index_template.render(
         active_session=active_session,
         categories=categories,
-        sessions=sessions_data,
+        sessions=[format_session(sess) for sess in sessions],
     )
+    home_page_cache = (etag, html)
+    return HTMLResponse(html, headers=headers)
 
 
 @app.get("/categories", response_class=HTMLResponse)
 def categories_page(db: Session = Depends(get_db)):
     """Categories management page."""
-    categories = db.query(Category).order_by(Category.sort_order).all()
-    template = jinja_env.get_template("categories.html")
-    return template.render(categories=categories)
+    categories = db.scalars(ALL_CATEGORIES_QUERY).all()
+    return categories_template.render(categories=categories)
 
 
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
+@app.get("/sessions.json")
+def list_sessions(db: Session = Depends(get_db)):
+    """List all sessions, most recent first, as JSON."""
+    return [format_session(sess) for sess in db.execute(SESSION_LIST_QUERY)]
+
+
 @app.post("/start")
 def start_session(
     category_id: Optional[int] = Form(None),
@@ -132,27 +270,18 @@ def start_session(
     db: Session = Depends(get_db),
 ):
     """Start a new work session."""
-    # Check if there's already an active session
-    active = get_active_session(db)
-    if active:
-        raise HTTPException(status_code=400, detail="A session is already running. Stop it first.")
-    
-    # Validate category if provided
-    if category_id:
-        cat = get_category_by_id(db, category_id)
-        if not cat:
-            raise HTTPException(status_code=404, detail="Category not found or inactive.")
-    
-    now = datetime.utcnow().isoformat() + "Z"
-    new_session = SessionModel(
-        category_id=category_id,
-        description=description or "",
-        start_utc=now,
-        end_utc=None,
-        created_utc=now,
-        updated_utc=now,
-    )
-    db.add(new_session)
+    stmt = START_SESSION_WITH_CATEGORY_STMT if category_id else START_SESSION_STMT
+    result = db.execute(stmt, {
+        "category_id": category_id,
+        "description": description or "",
+        "now": utc_now_iso(),
+    })
+    if result.rowcount == 0:
+        # Nothing inserted: either a session is running or the category is invalid
+        if get_active_session(db):
+            raise HTTPException(status_code=400, detail="A session is already running. Stop it first.")
+        raise HTTPException(status_code=404, detail="Category not found or inactive.")
+    bump_data_version(db)
     db.commit()
     
     # Redirect back to home
@@ -162,13 +291,15 @@ def start_session(
 @app.post("/stop")
 def stop_session(db: Session = Depends(get_db)):
     """Stop the currently running session."""
-    active = get_active_session(db)
-    if not active:
+    now = utc_now_iso()
+    result = db.execute(
+        update(SessionModel)
+        .where(SessionModel.end_utc.is_(None))
+        .values(end_utc=now, updated_utc=now)
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=400, detail="No active session to stop.")
-    
-    now = datetime.utcnow().isoformat() + "Z"
-    active.end_utc = now
-    active.updated_utc = now
+    bump_data_version(db)
     db.commit()
     
     return RedirectResponse(url="/", status_code=303)
@@ -184,134 +315,72 @@ def edit_session(
     db: Session = Depends(get_db),
 ):
     """Edit an existing session."""
-    logger.debug(f"=== EDIT SESSION START ===")
-    logger.debug(f"Session ID: {session_id}")
-    logger.debug(f"Raw Input - category_id: {category_id} (type: {type(category_id)})")
-    logger.debug(f"Raw Input - description: {repr(description)}")
-    logger.debug(f"Raw Input - start_utc: {repr(start_utc)}")
-    logger.debug(f"Raw Input - end_utc: {repr(end_utc)}")
-    
-    # Fetch session from database
-    try:
-        session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-        logger.debug(f"Database Query - Session found: {session is not None}")
-        if session:
-            logger.debug(f"  Current session state: id={session.id}, category_id={session.category_id}, "
-                        f"start={session.start_utc}, end={session.end_utc}, desc={repr(session.description)}")
-    except Exception as e:
-        logger.error(f"Database Query - Error fetching session: {type(e).__name__}: {str(e)}", exc_info=True)
-        raise
-    
-    if not session:
-        logger.error(f"Session not found for ID: {session_id}")
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
     # Validate and normalize times
     try:
-        logger.debug(f"Parsing start_utc: {repr(start_utc)}")
-        start_dt = date_parser.isoparse(start_utc)
-        logger.debug(f"  Parsed start_dt: {start_dt} (tzinfo: {start_dt.tzinfo})")
-        
-        # Replace timezone info and strip microseconds, then add Z
-        start_dt_clean = start_dt.replace(tzinfo=None, microsecond=0)
-        start_utc_normalized = start_dt_clean.isoformat() + "Z"
-        logger.debug(f"  Normalized start_utc: {start_utc_normalized}")
+        start_dt = parse_utc(start_utc)
+        start_utc_normalized = format_utc(start_dt)
         
         if end_utc:
-            logger.debug(f"Parsing end_utc: {repr(end_utc)}")
-            end_dt = date_parser.isoparse(end_utc)
-            logger.debug(f"  Parsed end_dt: {end_dt} (tzinfo: {end_dt.tzinfo})")
-            
-            logger.debug(f"Comparing times: end_dt ({end_dt}) <= start_dt ({start_dt})?")
+            end_dt = parse_utc(end_utc)
             if end_dt <= start_dt:
-                logger.error(f"Time validation failed: end_dt ({end_dt}) is not after start_dt ({start_dt})")
                 raise HTTPException(status_code=400, detail="End time must be after start time.")
-            
-            # Replace timezone info and strip microseconds, then add Z
-            end_dt_clean = end_dt.replace(tzinfo=None, microsecond=0)
-            end_utc_normalized = end_dt_clean.isoformat() + "Z"
-            logger.debug(f"  Normalized end_utc: {end_utc_normalized}")
+            end_utc_normalized = format_utc(end_dt)
         else:
             end_utc_normalized = None
-            logger.debug(f"No end_utc provided, setting to None")
     except HTTPException:
-        logger.error(f"DateTime validation failed - re-raising HTTPException")
         raise
     except Exception as e:
-        logger.error(f"DateTime parsing error: {type(e).__name__}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=f"Invalid datetime format: {str(e)}")
     
-    # Validate category if provided
-    try:
-        if category_id:
-            logger.debug(f"Validating category_id: {category_id}")
-            cat = get_category_by_id(db, category_id)
-            logger.debug(f"  Category lookup result: {cat is not None}")
-            if not cat:
-                logger.error(f"Category validation failed: category_id {category_id} not found or inactive")
-                raise HTTPException(status_code=404, detail="Category not found or inactive.")
-            logger.debug(f"  Category valid: {cat.name}")
-        else:
-            logger.debug(f"No category_id provided, skipping validation")
-    except HTTPException:
-        logger.error(f"Category validation failed - re-raising HTTPException")
-        raise
-    except Exception as e:
-        logger.error(f"Category validation error: {type(e).__name__}: {str(e)}", exc_info=True)
-        raise
+    # Update session directly. The category check rides along in the WHERE
+    # clause, so a valid edit is a single statement; zero rows updated means
+    # either the session or the category is missing.
+    stmt = update(SessionModel).where(SessionModel.id == session_id)
+    if category_id:
+        stmt = stmt.where(
+            exists().where(Category.id == category_id, Category.is_active == 1)
+        )
+    result = db.execute(
+        stmt.values(
+            category_id=category_id,
+            description=description or "",
+            start_utc=start_utc_normalized,
+            end_utc=end_utc_normalized,
+            updated_utc=utc_now_iso(),
+        )
+    )
     
-    # Update session
-    try:
-        logger.debug(f"Updating session object...")
-        logger.debug(f"  Setting category_id: {category_id}")
-        session.category_id = category_id
-        
-        logger.debug(f"  Setting description: {repr(description)}")
-        session.description = description or ""
-        
-        logger.debug(f"  Setting start_utc: {start_utc_normalized}")
-        session.start_utc = start_utc_normalized
-        
-        logger.debug(f"  Setting end_utc: {end_utc_normalized}")
-        session.end_utc = end_utc_normalized
-        
-        now = datetime.utcnow().isoformat() + "Z"
-        logger.debug(f"  Setting updated_utc: {now}")
-        session.updated_utc = now
-        
-        logger.debug(f"Updated session object: category_id={session.category_id}, "
-                    f"start={session.start_utc}, end={session.end_utc}, desc={repr(session.description)}")
-    except Exception as e:
-        logger.error(f"Error updating session object: {type(e).__name__}: {str(e)}", exc_info=True)
-        raise
+    if result.rowcount == 0:
+        if category_id and not get_category_by_id(db, category_id):
+            raise HTTPException(status_code=404, detail="Category not found or inactive.")
+        raise HTTPException(status_code=404, detail="Session not found.")
     
-    # Commit to database
     try:
-        logger.debug(f"Committing session changes to database...")
+        bump_data_version(db)
         db.commit()
-        logger.info(f"Session {session_id} successfully updated and committed to database")
     except Exception as e:
-        logger.error(f"Database commit failed: {type(e).__name__}: {str(e)}", exc_info=True)
+        logger.error("Failed to save session %s", session_id, exc_info=True)
         db.rollback()
-        logger.error(f"Transaction rolled back due to commit failure")
         raise HTTPException(status_code=500, detail=f"Failed to save session: {str(e)}")
     
-    logger.debug(f"=== EDIT SESSION SUCCESS ===")
+    logger.info("Session %s updated", session_id)
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.post("/sessions/{session_id}/delete")
 def delete_session(session_id: int, db: Session = Depends(get_db)):
     """Delete a session."""
-    session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
     # Don't allow deleting the active session
-    if session.end_utc is None:
+    result = db.execute(
+        delete(SessionModel)
+        .where(SessionModel.id == session_id, SessionModel.end_utc.is_not(None))
+    )
+    if result.rowcount == 0:
+        # Nothing deleted: the session is either missing or still running
+        if db.get(SessionModel, session_id) is None:
+            raise HTTPException(status_code=404, detail="Session not found.")
         raise HTTPException(status_code=400, detail="Cannot delete the active session. Stop it first.")
-    
-    db.delete(session)
+    bump_data_version(db)
     db.commit()
     
     return RedirectResponse(url="/", status_code=303)
@@ -324,24 +393,15 @@ def add_category(name: str = Form(...), db: Session = Depends(get_db)):
     if not name:
         raise HTTPException(status_code=400, detail="Category name cannot be empty.")
     
-    # Check if exists
-    existing = db.query(Category).filter(Category.name == name).first()
-    if existing:
+    # The unique index on name rejects duplicates, so no separate lookup is needed
+    try:
+        db.execute(ADD_CATEGORY_STMT, {"name": name, "now": utc_now_iso()})
+        bump_data_version(db)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Category already exists.")
     
-    now = datetime.utcnow().isoformat() + "Z"
-    # Get next sort_order
-    max_sort = db.query(Category).order_by(Category.sort_order.desc()).first()
-    next_sort = (max_sort.sort_order + 10) if max_sort else 10
-    
-    new_cat = Category(
-        name=name,
-        sort_order=next_sort,
-        created_utc=now,
-    )
-    db.add(new_cat)
-    db.commit()
-    
     return RedirectResponse(url="/categories", status_code=303)
 
 
@@ -352,23 +412,21 @@ def edit_category(
     db: Session = Depends(get_db),
 ):
     """Edit a category."""
-    cat = db.query(Category).filter(Category.id == category_id).first()
-    if not cat:
-        raise HTTPException(status_code=404, detail="Category not found.")
-    
     name = name.strip()
     if not name:
         raise HTTPException(status_code=400, detail="Category name cannot be empty.")
     
-    # Check if new name already exists (excluding self)
-    existing = db.query(Category).filter(
-        Category.name == name,
-        Category.id != category_id
-    ).first()
-    if existing:
+    # The unique index on name rejects renames onto another category's name
+    try:
+        result = db.execute(
+            update(Category).where(Category.id == category_id).values(name=name)
+        )
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Category name already exists.")
-    
-    cat.name = name
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Category not found.")
+    bump_data_version(db)
     db.commit()
     
     return RedirectResponse(url="/categories", status_code=303)
@@ -377,43 +435,75 @@ def edit_category(
 @app.post("/categories/{category_id}/delete")
 def delete_category(category_id: int, db: Session = Depends(get_db)):
     """Soft delete a category (set is_active=0)."""
-    cat = db.query(Category).filter(Category.id == category_id).first()
-    if not cat:
+    result = db.execute(
+        update(Category).where(Category.id == category_id).values(is_active=0)
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Category not found.")
-    
-    # Soft delete
-    cat.is_active = 0
+    bump_data_version(db)
     db.commit()
     
     return RedirectResponse(url="/categories", status_code=303)
 
 
+CSV_BATCH_SIZE = 1000
+CSV_HEADER = "ID,Category,Description,Start Time,End Time,Duration\r\n"
+CSV_ROW = "{},{},{},{},{},{}\r\n"
+CSV_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+
+
+def csv_field(value: str) -> str:
+    """Quote a CSV field only when needed, matching csv.writer's default dialect."""
+    if CSV_NEEDS_QUOTING.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def iter_sessions_csv():
+    """Yield the sessions CSV in chunks of CSV_BATCH_SIZE rows.
+
+    Uses its own database session because the body is streamed after the
+    endpoint has returned. Only category and description are free text;
+    IDs, timestamps and durations never need quoting.
+    """
+    db = SessionLocal()
+    try:
+        chunk = [CSV_HEADER]
+        sessions = db.execute(SESSION_LIST_QUERY, execution_options={"yield_per": CSV_BATCH_SIZE})
+        for i, sess in enumerate(sessions, 1):
+            duration = format_time_diff(sess.start_utc, sess.end_utc) if sess.end_utc else ""
+            chunk.append(CSV_ROW.format(
+                sess.id,
+                csv_field(sess.category_name or "(No Category)"),
+                csv_field(sess.description),
+                sess.start_utc,
+                sess.end_utc or "",
+                duration,
+            ))
+            if i % CSV_BATCH_SIZE == 0:
+                yield "".join(chunk)
+                chunk = []
+        
+        yield "".join(chunk)
+    finally:
+        db.close()
+
+
 @app.get("/export.csv")
-def export_csv(db: Session = Depends(get_db)):
+def export_csv(request: Request, db: Session = Depends(get_db)):
     """Export all sessions as CSV."""
-    sessions = db.query(SessionModel).order_by(SessionModel.start_utc.desc()).all()
-    
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["ID", "Category", "Description", "Start Time", "End Time", "Duration"])
-    
-    for sess in sessions:
-        cat = get_category_by_id(db, sess.category_id) if sess.category_id else None
-        duration = format_time_diff(sess.start_utc, sess.end_utc) if sess.end_utc else ""
-        writer.writerow([
-            sess.id,
-            cat.name if cat else "(No Category)",
-            sess.description,
-            sess.start_utc,
-            sess.end_utc or "",
-            duration,
-        ])
-    
-    output.seek(0)
+    etag = get_etag(db)
+    headers = {
+        "Content-Disposition": "attachment; filename=sessions.csv",
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     return StreamingResponse(
-        iter([output.getvalue()]),
+        iter_sessions_csv(),
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=sessions.csv"}
+        headers=headers,
     )
 
 
@@ -425,7 +515,9 @@ def import_sessions(
     """Import sessions from CSV data."""
     try:
         reader = csv.DictReader(StringIO(csv_data))
-        imported = 0
+        now = utc_now_iso()
+        category_ids = dict(db.execute(CATEGORY_IDS_BY_NAME_QUERY).all())
+        rows = []
         errors = []
         
         for row in reader:
@@ -433,9 +525,7 @@ def import_sessions(
                 # Parse category
                 category_id = None
                 if row.get("Category") and row["Category"] != "(No Category)":
-                    cat = db.query(Category).filter(Category.name == row["Category"]).first()
-                    if cat:
-                        category_id = cat.id
+                    category_id = category_ids.get(row["Category"])
                 
                 # Parse times
                 start_utc = row.get("Start Time", "").strip()
@@ -447,35 +537,37 @@ def import_sessions(
                 
                 # Normalize times
                 try:
-                    start_dt = date_parser.isoparse(start_utc)
-                    start_utc = start_dt.replace(tzinfo=None, microsecond=0).isoformat() + "Z"
+                    start_dt = parse_utc(start_utc)
+                    start_utc = format_utc(start_dt)
                 except:
                     errors.append(f"Row skipped: invalid start time '{start_utc}'")
                     continue
                 
                 if end_utc:
                     try:
-                        end_dt = date_parser.isoparse(end_utc)
-                        end_utc = end_dt.replace(tzinfo=None, microsecond=0).isoformat() + "Z"
+                        end_dt = parse_utc(end_utc)
+                        end_utc = format_utc(end_dt)
                     except:
                         errors.append(f"Row skipped: invalid end time '{end_utc}'")
                         continue
                 
-                now = datetime.utcnow().isoformat() + "Z"
-                new_session = SessionModel(
-                    category_id=category_id,
-                    description=row.get("Description", ""),
-                    start_utc=start_utc,
-                    end_utc=end_utc,
-                    created_utc=now,
-                    updated_utc=now,
-                )
-                db.add(new_session)
-                imported += 1
+                rows.append({
+                    "category_id": category_id,
+                    "description": row.get("Description", ""),
+                    "start_utc": start_utc,
+                    "end_utc": end_utc,
+                    "created_utc": now,
+                    "updated_utc": now,
+                })
             except Exception as e:
                 errors.append(f"Row error: {str(e)}")
         
+        # One executemany INSERT for all valid rows
+        if rows:
+            db.execute(insert(SessionModel), rows)
+        bump_data_version(db)
         db.commit()
+        imported = len(rows)
         
         msg = f"Imported {imported} sessions."
         if errors:
@@ -488,6 +580,62 @@ def import_sessions(
         raise HTTPException(status_code=400, detail=f"Import failed: {str(e)}")
 
 
+# RETURNING rows from an executemany only follow the input order when asked
+BULK_INSERT_SESSIONS_STMT = insert(SessionModel).returning(
+    SessionModel.id, sort_by_parameter_order=True
+)
+
+
+class SessionIn(BaseModel):
+    """A completed session to create through /admin/bulk_sessions."""
+    category_id: Optional[int] = None
+    description: str = ""
+    start_utc: str
+    end_utc: str
+
+
+@app.post("/admin/bulk_sessions")
+def bulk_create_sessions(sessions: List[SessionIn], db: Session = Depends(get_db)):
+    """Create completed sessions from a JSON array in one executemany INSERT."""
+    now = utc_now_iso()
+    rows = []
+    for item in sessions:
+        try:
+            start_dt = parse_utc(item.start_utc)
+            end_dt = parse_utc(item.end_utc)
+            # Raises TypeError when only one of the two carries an offset
+            ends_first = end_dt <= start_dt
+        except (ValueError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid datetime format: {str(e)}")
+        if ends_first:
+            raise HTTPException(status_code=400, detail="End time must be after start time.")
+        rows.append({
+            "category_id": item.category_id,
+            "description": item.description,
+            "start_utc": format_utc(start_dt),
+            "end_utc": format_utc(end_dt),
+            "created_utc": now,
+            "updated_utc": now,
+        })
+    
+    # Check every referenced category in one query, as /start and edit do per row
+    category_ids = {row["category_id"] for row in rows} - {None}
+    if category_ids:
+        found = set(db.scalars(ACTIVE_CATEGORY_IDS_QUERY, {"category_ids": list(category_ids)}))
+        missing = category_ids - found
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Category not found or inactive: {', '.join(map(str, sorted(missing)))}.",
+            )
+    
+    ids = db.scalars(BULK_INSERT_SESSIONS_STMT, rows).all() if rows else []
+    bump_data_version(db)
+    db.commit()
+    
+    return {"status": "ok", "imported": len(ids), "ids": ids}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,6 +1,6 @@
 """SQLAlchemy models for categories and sessions."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, text
 from app.db import Base
 
 
@@ -13,6 +13,11 @@ class Category(Base):
     is_active = Column(Integer, default=1, nullable=False)  # 1=active, 0=soft deleted
     sort_order = Column(Integer, default=0, nullable=False)
     created_utc = Column(String(50), nullable=False)
+    
+    __table_args__ = (
+        # Matches the dashboard's "active categories ordered by sort_order" query
+        Index('idx_categories_active_sort', 'is_active', 'sort_order'),
+    )
 
     def __repr__(self):
         return f"<Category(id={self.id}, name={self.name})>"
@@ -31,8 +36,25 @@ class Session(Base):
     updated_utc = Column(String(50), nullable=False)
     
     __table_args__ = (
-        Index('idx_end_utc_is_null', 'end_utc'),
+        # Partial index: only the (at most one) running session is indexed
+        Index(
+            'idx_sessions_active',
+            'end_utc',
+            sqlite_where=text('end_utc IS NULL'),
+            postgresql_where=text('end_utc IS NULL'),
+        ),
     )
 
     def __repr__(self):
         return f"<Session(id={self.id}, category_id={self.category_id}, start={self.start_utc})>"
+
+
+class DataVersion(Base):
+    """Single-row counter bumped by every write, used for HTTP cache validation."""
+    __tablename__ = "data_version"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<DataVersion(version={self.version})>"
@@ -0,0 +1,191 @@
+"""End-to-end tests for editing sessions against a running server.
+
+Start the app first (``uvicorn app.main:app --port 8000``), then run
+``pytest tests``. Set TRACKER_URL to target a different server.
+"""
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+BASE_URL = os.getenv("TRACKER_URL", "http://localhost:8000")
+READY_TIMEOUT = 10
+
+
+@pytest.fixture(scope="module")
+def http():
+    """One keep-alive HTTP session for the whole module, once the server answers."""
+    with requests.Session() as http:
+        deadline = time.monotonic() + READY_TIMEOUT
+        while True:
+            try:
+                http.get(f"{BASE_URL}/sessions.json", timeout=1)
+                break
+            except requests.ConnectionError:
+                if time.monotonic() > deadline:
+                    pytest.skip(f"server not reachable at {BASE_URL}")
+                time.sleep(0.2)
+        yield http
+
+
+@pytest.fixture
+def running_session(http):
+    """Start a fresh session, return its JSON record, and delete it afterwards."""
+    sessions = http.get(f"{BASE_URL}/sessions.json").json()
+    if any(s["is_running"] for s in sessions):
+        pytest.skip("a session is already running on the server; not stopping it")
+
+    response = http.post(
+        f"{BASE_URL}/start",
+        data={"category_id": "1", "description": "Test session"},
+        allow_redirects=False,
+    )
+    assert response.status_code == 303, response.text
+
+    sessions = http.get(f"{BASE_URL}/sessions.json").json()
+    session = next(s for s in sessions if s["is_running"])
+    yield session
+
+    http.post(f"{BASE_URL}/stop", allow_redirects=False)
+    delete_session(http, session["id"])
+
+
+@pytest.fixture
+def completed_session(http):
+    """Seed a finished session through the bulk endpoint, return its ID, and delete it afterwards."""
+    response = http.post(f"{BASE_URL}/admin/bulk_sessions", json=[{
+        "category_id": 1,
+        "description": "Seeded session",
+        "start_utc": "2026-01-01T09:00:00Z",
+        "end_utc": "2026-01-01T10:00:00Z",
+    }])
+    assert response.status_code == 200, response.text
+    session_id = response.json()["ids"][0]
+    yield session_id
+
+    delete_session(http, session_id)
+
+
+def delete_session(http, session_id):
+    """Remove a session a fixture created."""
+    http.post(f"{BASE_URL}/sessions/{session_id}/delete", allow_redirects=False)
+
+
+def get_session(http, session_id):
+    """Fetch one session's JSON record by ID."""
+    sessions = http.get(f"{BASE_URL}/sessions.json").json()
+    return next(s for s in sessions if s["id"] == session_id)
+
+
+def edit(http, session_id, **data):
+    """Submit the edit form for a session without following the redirect."""
+    return http.post(
+        f"{BASE_URL}/sessions/{session_id}/edit",
+        data=data,
+        allow_redirects=False,
+    )
+
+
+def test_edit_session(http, running_session):
+    """Setting an end time one hour after the start stops the session."""
+    start_dt = datetime.fromisoformat(running_session["start_utc"].removesuffix("Z"))
+    new_start = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    new_end = (start_dt + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    response = edit(
+        http,
+        running_session["id"],
+        category_id="1",
+        description="Updated test session",
+        start_utc=new_start,
+        end_utc=new_end,
+    )
+    assert response.status_code == 303, response.text
+
+    session = get_session(http, running_session["id"])
+    assert session["start_utc"] == new_start
+    assert session["end_utc"] == new_end
+    assert session["duration"] == "01:00:00"
+    assert session["description"] == "Updated test session"
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2026-01-27T15:53:55", "2026-01-27T16:53:55"),    # datetime-local input
+    ("2026-01-27T15:53:55Z", "2026-01-27T16:53:55Z"),  # explicit UTC
+])
+def test_edit_with_datetime_local_format(http, completed_session, start, end):
+    """The formats a browser datetime-local input submits are accepted."""
+    response = edit(
+        http,
+        completed_session,
+        category_id="1",
+        description="Updated",
+        start_utc=start,
+        end_utc=end,
+    )
+    assert response.status_code == 303, response.text
+
+    session = get_session(http, completed_session)
+    assert session["start_utc"] == "2026-01-27T15:53:55Z"
+    assert session["end_utc"] == "2026-01-27T16:53:55Z"
+
+
+def test_edit_keeps_start_time_without_end(http, running_session):
+    """Resubmitting the stored start time with no end keeps the session running."""
+    response = edit(
+        http,
+        running_session["id"],
+        category_id="1",
+        description="Edited",
+        start_utc=running_session["start_utc"],
+    )
+    assert response.status_code == 303, response.text
+
+    session = get_session(http, running_session["id"])
+    assert session["start_utc"] == running_session["start_utc"]
+    assert session["is_running"]
+
+
+def test_edit_rejects_end_before_start(http, completed_session):
+    """End times at or before the start are refused."""
+    response = edit(
+        http,
+        completed_session,
+        start_utc="2026-01-27T16:53:55Z",
+        end_utc="2026-01-27T15:53:55Z",
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", ["/", "/export.csv"])
+def test_unchanged_page_revalidates_with_304(http, path):
+    """Sending back the ETag while nothing has changed gets an empty 304."""
+    etag = http.get(f"{BASE_URL}{path}").headers["ETag"]
+
+    response = http.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.parametrize("path", ["/", "/export.csv"])
+def test_edit_invalidates_etag(http, completed_session, path):
+    """Any write gives the dashboard and export a new ETag and fresh content."""
+    etag = http.get(f"{BASE_URL}{path}").headers["ETag"]
+
+    response = edit(
+        http,
+        completed_session,
+        category_id="1",
+        description="Cache buster",
+        start_utc="2026-01-01T09:00:00Z",
+        end_utc="2026-01-01T10:00:00Z",
+    )
+    assert response.status_code == 303, response.text
+
+    response = http.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "Cache buster" in response.text